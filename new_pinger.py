@@ -5,8 +5,20 @@ import socket
 import time
 import subprocess
 import re
-import ipaddress
+import errno
+import struct
+import threading
+import _thread
+import resource
+import itertools
+import json
+import array
+import asyncio
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # ANSI color definitions
@@ -16,42 +28,104 @@ YELLOW  = "\033[33m"
 RED     = "\033[31m"
 GREEN   = "\033[32m"
 
+# ICMP message types
+ICMP_ECHO_REPLY   = 0
+ICMP_ECHO_REQUEST = 8
+
+# Round-trip statistics line printed by the ping command.
+PING_RTT_RE = re.compile(r"([\d.]+)/([\d.]+)/([\d.]+)/(?:[\d.]+|nan)\s*ms")
+
+# History symbols, stored as single bytes in each test's ring buffer.
+SYMBOL_FAST = ord(".")   # under 10 ms, or no latency reported
+SYMBOL_SLOW = ord("o")   # under 100 ms
+SYMBOL_SLOWER = ord("O") # 100 ms or more
+SYMBOL_DOWN = ord("X")   # no response
+
+# Colors are applied when the history is rendered, not stored in it.
+# HISTORY_CELLS maps every symbol byte to its colored display string.
+HISTORY_CELLS = [chr(symbol) for symbol in range(256)]
+HISTORY_CELLS[SYMBOL_FAST] = f"{GREEN}.{RESET}"
+HISTORY_CELLS[SYMBOL_SLOW] = f"{BOLD}{YELLOW}o{RESET}"
+HISTORY_CELLS[SYMBOL_DOWN] = f"{RED}X{RESET}"
+
+# Status cell for a test that is down, padded to the 10 visible columns of
+# the Status column (the escape codes take up no space on screen).
+DOWN_CELL = f"      {BOLD}{RED}DOWN{RESET}"
+
+# Column header printed above each host's tests.
+TESTS_HEADER = f"    {'Test':<15} {'Status':>10}   {'History':<35}  {'Last Seen'}"
+
 def clear_screen():
     """Clear the terminal screen."""
-    print("\033[H\033[J", end="")
+    print("\033[H\033[J", end="", flush=True)
 
-def format_status(s, width=10):
+def icmp_checksum(data):
+    """Compute the RFC 1071 internet checksum of data."""
+    if len(data) % 2:
+        data += b"\0"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+def open_icmp_socket():
     """
-    Pad a string s to a fixed width (ignoring ANSI escape sequences)
-    so that columns line up.
+    Open a non-blocking socket for sending ICMP echo requests.
+    Tries an unprivileged ICMP datagram socket first, then a raw socket.
+    Returns None if neither is permitted on this system.
     """
-    clean = re.sub(r'\x1B\[[0-?]*[ -/]*[@-~]', '', s)
-    padding = width - len(clean)
-    return (" " * padding + s) if padding > 0 else s
+    for sock_type in (socket.SOCK_DGRAM, socket.SOCK_RAW):
+        try:
+            sock = socket.socket(socket.AF_INET, sock_type, socket.IPPROTO_ICMP)
+        except OSError:
+            continue
+        sock.setblocking(False)
+        return sock
+    return None
 
 class TestResult:
     """
     Represents one test (ICMP or TCP) for a host.
-    Maintains a fixed-length history of measurements.
+    The latency and the fixed-length history of measurements live in flat
+    arrays owned by the MultiPing instance; a TestResult is a view onto
+    its own slot in them.
     """
-    def __init__(self, protocol, port=None, history_length=35):
+    def __init__(self, owner, ip, protocol, port=None):
+        self.owner = owner
+        self.index = len(owner.latencies)  # slot in owner.latencies
+        self.history_length = owner.history_length
+        self.offset = self.index * self.history_length  # start of the history in owner.histories
+        owner.latencies.append(-1)
+        owner.histories.extend(b"." * self.history_length)
         self.protocol = protocol.upper()  # "ICMP" or "TCP"
         self.port = port                  # For TCP tests; None for ICMP
-        self.history = ["."] * history_length
-        self.latency = -1                 # in milliseconds (-1 means no response)
+        # Socket address the probe is sent to, built once and reused every cycle.
+        self.address = (ip, port if self.protocol == "TCP" else 0)
         self.last_seen = "Last seen: " + time.strftime("%c")
         self.service = ""                 # For TCP: "open" or "closed"
+        # Display label, padded to the width of the Test column.
+        self.label = "ICMP" if self.protocol == "ICMP" else f"TCP port {port}"
+        self.label_padded = f"{self.label:<15}"
+
+    @property
+    def latency(self):
+        """Latest latency in milliseconds (-1 means no response)."""
+        return self.owner.latencies[self.index]
 
-    def update_history(self, index, symbol):
-        self.history[index] = symbol
+    @latency.setter
+    def latency(self, value):
+        self.owner.latencies[self.index] = value
 
-    def get_history_string(self, current_index, history_length):
-        """Return the history chart as a string (oldest to newest)."""
-        s = ""
-        for i in range(history_length):
-            idx = (current_index - i + history_length) % history_length
-            s += self.history[idx]
-        return s
+    def get_history_bytes(self, newest_index):
+        """
+        Return the history symbols as bytes (oldest to newest).
+        The slot index moves down by one each cycle, so reading the buffer
+        forward from the newest slot and reversing gives chronological order.
+        """
+        histories = self.owner.histories
+        start = self.offset
+        newest = start + newest_index
+        return (histories[newest:start + self.history_length] + histories[start:newest])[::-1]
 
 class Host:
     """
@@ -59,13 +133,13 @@ class Host:
     """
     def __init__(self, ip, description, tests, history_length=35):
         try:
-            ipaddress.IPv4Address(ip)
-        except ipaddress.AddressValueError:
+            socket.inet_pton(socket.AF_INET, ip)
+        except (OSError, TypeError):
             sys.exit(f"Invalid IP address: {ip}")
         self.ip = ip
         self.description = description
-        # If no tests are provided, default to a single ICMP test.
-        self.tests = tests if tests else [TestResult("ICMP", history_length=history_length)]
+        self.header = f"{BOLD}{description:<20}{RESET} ({ip})"
+        self.tests = tests
         self.history_length = history_length
 
 class MultiPing:
@@ -78,17 +152,90 @@ class MultiPing:
         self.history_length = history_length
         self.current_index = history_length - 1
         self.hosts = []
+        # Per-test state, stored struct-of-arrays style: test i's latency is
+        # latencies[i] and its history ring buffer is
+        # histories[i * history_length:(i + 1) * history_length].
+        self.latencies = array.array("d")
+        self.histories = bytearray()
         self.load_config()
+        hostname = socket.gethostname()
+        self.running_on = f"Running on {hostname} ({socket.gethostbyname(hostname)})"
+        self.stdout_is_tty = sys.stdout.isatty()
+        # Guards test results and current_index between the test cycle and
+        # the display thread.
+        self.lock = threading.Lock()
+        self.display_error = None         # set if the display thread fails
+        # All tests run as coroutines on one event loop, driven from the
+        # thread that calls update_tests.
+        self.loop = asyncio.new_event_loop()
+        # Every pending TCP connect holds a socket open, so cap how many run
+        # at once to stay well inside the open file limit.
+        fd_limit, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if fd_limit == resource.RLIM_INFINITY:
+            fd_limit = 4096
+        self.tcp_slots = asyncio.Semaphore(max(1, min(1024, fd_limit // 2)))
+        # A single ICMP socket is shared by all tests. One reader callback
+        # hands replies to the waiting test by (ip, sequence); on a raw socket
+        # the identifier is checked too, since raw sockets see every ICMP
+        # packet on the host.
+        self.icmp_socket = open_icmp_socket()
+        self.icmp_raw = self.icmp_socket is not None and self.icmp_socket.type == socket.SOCK_RAW
+        self.icmp_ident = os.getpid() & 0xFFFF
+        self.icmp_sequence = itertools.count()
+        self.icmp_waiters = {}
+        if self.icmp_socket is not None:
+            self.loop.add_reader(self.icmp_socket, self.receive_icmp_replies)
+        # Worker threads are only needed for the ping command fallback.
+        icmp_tests = sum(1 for host in self.hosts for test in host.tests if test.protocol == "ICMP")
+        self.executor = ThreadPoolExecutor(max_workers=max(1, min(64, icmp_tests)),
+                                           thread_name_prefix="pinger")
 
-    def load_config(self):
-        """Load hosts from a YAML file with the specified structure."""
-        if not os.path.exists(self.config_file):
-            sys.exit(f"Config file not found: {self.config_file}")
+    def read_config_data(self):
+        """
+        Return the parsed contents of the config file.
+        The parsed structure is cached as JSON next to the YAML file together
+        with the YAML file's mtime, ctime, size and inode, and reused only
+        while all of them still match exactly. The ctime cannot be set from
+        user space, so edits that preserve the mtime (cp -p, rsync -t, tar)
+        still invalidate the cache.
+        """
+        cache_file = self.config_file + ".cache.json"
+        # Stat before parsing, so an edit made while parsing invalidates the cache.
+        config_stat = os.stat(self.config_file)
+        stat_key = [config_stat.st_mtime_ns, config_stat.st_ctime_ns,
+                    config_stat.st_size, config_stat.st_ino]
+        try:
+            with open(cache_file, "r") as f:
+                cache = json.load(f)
+            if isinstance(cache, dict) and cache.get("stat") == stat_key and "data" in cache:
+                return cache["data"]
+        except (OSError, ValueError):
+            pass
         with open(self.config_file, "r") as f:
             try:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=SafeLoader)
             except Exception as e:
                 sys.exit(f"Error parsing YAML file: {e}")
+        cache = {"stat": stat_key, "data": data}
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, "w") as f:
+                json.dump(cache, f)
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError):
+            # The cache is only an optimization; if it cannot be written
+            # the YAML file is simply parsed again next time.
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+        return data
+
+    def load_config(self):
+        """Load hosts from a YAML file with the specified structure."""
+        if not os.path.exists(self.config_file):
+            sys.exit(f"Config file not found: {self.config_file}")
+        data = self.read_config_data()
         if "hosts" not in data:
             sys.exit("YAML file must contain a 'hosts' key.")
         self_ips = []
@@ -115,23 +262,75 @@ class MultiPing:
                                 try:
                                     start, end = port_val.split("-")
                                     for p in range(int(start), int(end) + 1):
-                                        tests.append(TestResult("TCP", p, self.history_length))
+                                        tests.append(TestResult(self, ip, "TCP", p))
                                 except Exception as e:
                                     sys.exit(f"Error expanding port range '{port_val}' for {ip}: {e}")
                             else:
                                 try:
                                     port_num = int(port_val)
-                                    tests.append(TestResult("TCP", port_num, self.history_length))
+                                    tests.append(TestResult(self, ip, "TCP", port_num))
                                 except Exception as e:
                                     sys.exit(f"Error converting port '{port_val}' for {ip}: {e}")
                         else:
-                            tests.append(TestResult("ICMP", history_length=self.history_length))
-                else:
-                    tests.append(TestResult("ICMP", history_length=self.history_length))
+                            tests.append(TestResult(self, ip, "ICMP"))
+                # Default to a single ICMP test, including when the listed
+                # tests expanded to nothing (e.g. an empty port range).
+                if not tests:
+                    tests.append(TestResult(self, ip, "ICMP"))
                 self.hosts.append(Host(ip, description, tests, self.history_length))
 
+    async def run_icmp_test(self, address):
+        """
+        Send an ICMP echo request to address, an (ip, 0) tuple, over the
+        shared socket and wait up to 0.5 seconds for the matching reply.
+        Returns (up, latency_in_ms).
+        Falls back to the ping command if no ICMP socket could be opened.
+        """
+        ip = address[0]
+        if self.icmp_socket is None:
+            return await self.loop.run_in_executor(self.executor, self.run_ping_command, ip)
+        seq = next(self.icmp_sequence) & 0xFFFF
+        key = (ip, seq)
+        payload = struct.pack("!d", time.monotonic())
+        header = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, 0, self.icmp_ident, seq)
+        checksum = icmp_checksum(header + payload)
+        packet = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, checksum, self.icmp_ident, seq) + payload
+        waiter = self.loop.create_future()
+        self.icmp_waiters[key] = waiter
+        try:
+            start_time = time.perf_counter()
+            self.icmp_socket.sendto(packet, address)
+            received = await asyncio.wait_for(waiter, 0.5)
+            return True, (received - start_time) * 1000
+        except (OSError, asyncio.TimeoutError):
+            return False, None
+        finally:
+            del self.icmp_waiters[key]
+
+    def receive_icmp_replies(self):
+        """Drain the ICMP socket, completing the waiter of every reply that answers a pending request."""
+        while True:
+            try:
+                packet, (addr, _) = self.icmp_socket.recvfrom(1024)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                continue
+            received = time.perf_counter()
+            if self.icmp_raw:
+                # Raw sockets deliver the IP header as well; skip it.
+                packet = packet[(packet[0] & 0x0F) * 4:]
+            if len(packet) < 8:
+                continue
+            icmp_type, _, _, ident, seq = struct.unpack("!BBHHH", packet[:8])
+            if icmp_type != ICMP_ECHO_REPLY or (self.icmp_raw and ident != self.icmp_ident):
+                continue
+            waiter = self.icmp_waiters.get((addr, seq))
+            if waiter is not None and not waiter.done():
+                waiter.set_result(received)
+
     @staticmethod
-    def run_icmp_test(ip):
+    def run_ping_command(ip):
         """
         Run an ICMP test using the ping command with a 1-second timeout.
         Returns (up, latency_in_ms) using the average round-trip time.
@@ -147,8 +346,7 @@ class MultiPing:
         if up:
             # Match the round-trip statistics line:
             # e.g., "round-trip min/avg/max/stddev = 15.086/15.086/15.086/0.000 ms"
-            regex = r"([\d\.]+)/([\d\.]+)/([\d\.]+)/((?:[\d\.]+|nan))\s*ms"
-            m = re.search(regex, stdout)
+            m = PING_RTT_RE.search(stdout)
             if m:
                 try:
                     avg_latency_str = m.group(2)
@@ -160,118 +358,206 @@ class MultiPing:
                     latency = None
         return up, latency
 
-    @staticmethod
-    def run_tcp_test(ip, port):
-        """Run a TCP test by attempting a connection; return (open, latency_in_ms)."""
-        start_time = time.time()
+    async def run_tcp_test(self, address):
+        """
+        Run a TCP test by attempting a non-blocking connection to address,
+        an (ip, port) tuple; return (open, latency_in_ms).
+        """
+        async with self.tcp_slots:
+            return await self.connect_tcp(address)
+
+    async def connect_tcp(self, address):
+        """
+        Perform one TCP connection attempt for run_tcp_test.
+        Failing to create the socket is a local error, not a closed port,
+        so it is raised rather than reported as a failed test.
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        fd = sock.fileno()
         try:
-            sock = socket.create_connection((ip, port), timeout=0.5)
-            sock.close()
-            latency = (time.time() - start_time) * 1000
-            return True, latency
-        except Exception:
+            start_time = time.perf_counter()
+            # Connect directly rather than through loop.sock_connect: the
+            # address is already a numeric IPv4 tuple, so this saves its
+            # address check and the extra wrapper future on every probe.
+            err = sock.connect_ex(address)
+            if err in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                writable = self.loop.create_future()
+                self.loop.add_writer(fd, self.resolve_writable, fd, writable)
+                try:
+                    await asyncio.wait_for(writable, 0.5)
+                finally:
+                    self.loop.remove_writer(fd)
+                err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+            if err:
+                return False, None
+            return True, (time.perf_counter() - start_time) * 1000
+        except (OSError, asyncio.TimeoutError):
             return False, None
+        finally:
+            sock.close()
+
+    def resolve_writable(self, fd, waiter):
+        """Writer callback: stop watching fd and wake the connect waiting on it."""
+        self.loop.remove_writer(fd)
+        if not waiter.done():
+            waiter.set_result(None)
+
+    async def run_cycle(self):
+        """
+        Run every test concurrently on the event loop.
+        Returns a list of (host, test, (up, latency_in_ms)).
+        """
+        tasks = []
+        for host in self.hosts:
+            for test in host.tests:
+                if test.protocol == "ICMP":
+                    tasks.append((host, test, self.run_icmp_test(test.address)))
+                elif test.protocol == "TCP":
+                    tasks.append((host, test, self.run_tcp_test(test.address)))
+        results = await asyncio.gather(*(coro for _, _, coro in tasks), return_exceptions=True)
+        # Tests report unreachable hosts as (False, None) themselves; anything
+        # raised is a local problem (e.g. out of file descriptors) and must
+        # not be shown as the host being down.
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return [(host, test, result) for (host, test, _), result in zip(tasks, results)]
 
     @staticmethod
     def symbol_for_latency(latency):
         """Return a symbol based on latency (in ms)."""
         if latency is None:
-            return "."
+            return SYMBOL_FAST
         elif latency < 10:
-            return "."
+            return SYMBOL_FAST
         elif latency < 100:
-            return f"{BOLD}{YELLOW}o{RESET}"
+            return SYMBOL_SLOW
         else:
-            return "O"
+            return SYMBOL_SLOWER
 
     def update_tests(self):
-        """Run all tests in parallel and update their history slot."""
-        # First, mark the current slot as failure ("X") for all tests.
-        for host in self.hosts:
-            for test in host.tests:
-                test.update_history(self.current_index, "X")
-                test.latency = -1
-
-        # Prepare to run all tests concurrently.
-        tasks = []
-        with ThreadPoolExecutor(max_workers=20) as executor:
-            for host in self.hosts:
-                ip = host.ip
-                for test in host.tests:
-                    if test.protocol == "ICMP":
-                        future = executor.submit(self.run_icmp_test, ip)
-                        tasks.append((host, test, future))
-                    elif test.protocol == "TCP":
-                        future = executor.submit(self.run_tcp_test, ip, test.port)
-                        tasks.append((host, test, future))
-            # Process the results as they complete.
-            for host, test, future in tasks:
-                try:
-                    result = future.result(timeout=0.5)
-                except Exception:
-                    result = (False, None)
+        """
+        Run all tests in parallel, update their history slot, and move on
+        to the next slot. Results are applied under the display lock, so a
+        frame never shows a partially updated cycle.
+        """
+        # Shared by every test that goes down in this cycle.
+        last_seen_now = "Last seen: " + time.strftime("%c")
+        results = self.loop.run_until_complete(self.run_cycle())
+        # Process the results, writing straight into the flat arrays. Every
+        # test gets a result, so each slot is written exactly once.
+        latencies = self.latencies
+        histories = self.histories
+        with self.lock:
+            current_index = self.current_index
+            for host, test, result in results:
                 up, latency = result
-                if test.protocol == "ICMP":
-                    if up:
-                        test.latency = latency if latency is not None else 0
-                        symbol = self.symbol_for_latency(latency)
-                        test.update_history(self.current_index, symbol)
-                        test.last_seen = ""
-                    else:
-                        test.latency = -1
-                        if test.last_seen == "":
-                            test.last_seen = "Last seen: " + time.strftime("%c")
-                        test.update_history(self.current_index, "X")
-                elif test.protocol == "TCP":
-                    if up:
-                        test.latency = latency if latency is not None else 0
-                        symbol = self.symbol_for_latency(latency)
-                        test.update_history(self.current_index, symbol)
-                        test.last_seen = ""
-                        test.service = "open"
-                    else:
-                        test.latency = -1
-                        if test.last_seen == "":
-                            test.last_seen = "Last seen: " + time.strftime("%c")
-                        test.update_history(self.current_index, "X")
-                        test.service = "closed"
+                if up:
+                    latencies[test.index] = latency if latency is not None else 0
+                    histories[test.offset + current_index] = self.symbol_for_latency(latency)
+                    test.last_seen = ""
+                else:
+                    latencies[test.index] = -1
+                    if test.last_seen == "":
+                        test.last_seen = last_seen_now
+                    histories[test.offset + current_index] = SYMBOL_DOWN
+                if test.protocol == "TCP":
+                    test.service = "open" if up else "closed"
+            self.current_index -= 1
+            if self.current_index < 0:
+                self.current_index = self.history_length - 1
 
-    def colorize_history(self, history_str):
-        return ''.join(f"{GREEN}.{RESET}" if c == '.' else f"{RED}X{RESET}" for c in history_str)
+    def render_rows(self, tests):
+        """Return the display row of each test in tests."""
+        # The slot written by the most recent completed cycle.
+        newest_index = (self.current_index + 1) % self.history_length
+        latencies = self.latencies
+        cells = HISTORY_CELLS
+        rows = []
+        append = rows.append
+        for test in tests:
+            latency = latencies[test.index]
+            if latency == -1:
+                status = DOWN_CELL
+            else:
+                status = f"{latency:>8.1f}ms"
+            history = "".join([cells[symbol] for symbol in test.get_history_bytes(newest_index)])
+            append(f"    {test.label_padded} {status}   {history}  {test.last_seen}")
+        return rows
 
     def display_results(self):
-        """Clear the screen and display test results in organized columns."""
-        clear_screen()
-        print(f"{BOLD}\n\nMultiPing NG - {RESET}{time.strftime('%c')}\n\n")
-        print(f"Running on {socket.gethostname()} ({socket.gethostbyname(socket.gethostname())})\n\n")
-        for host in self.hosts:
-            print(f"{BOLD}{host.description:<20}{RESET} ({host.ip})")
-            header = f"{'Test':<15} {'Status':>10}   {'History':<35}  {'Last Seen'}"
-            print("    " + header)
-            for test in host.tests:
-                if test.protocol == "ICMP":
-                    label = "ICMP"
-                    status_plain = "DOWN" if test.latency == -1 else f"{test.latency:.1f}ms"
-                    status = f"{BOLD}{RED}DOWN{RESET}" if test.latency == -1 else status_plain
-                elif test.protocol == "TCP":
-                    label = f"TCP port {test.port}"
-                    status_plain = "DOWN" if test.latency == -1 else f"{test.latency:.1f}ms"
-                    status = f"{BOLD}{RED}DOWN{RESET}" if test.latency == -1 else status_plain
-                history = test.get_history_string(self.current_index -1, self.history_length)
-                status_formatted = format_status(status, 10)
-                row = f"{label:<15} {status_formatted}   {(self.colorize_history(history)):<35}  {test.last_seen}"
-                print("    " + row)
-            print()
+        """
+        Redraw the screen with test results in organized columns.
+        The frame is assembled in memory and written with a single write,
+        drawing over the previous frame instead of clearing the screen.
+        """
+        lines = ["", "", f"{BOLD}MultiPing NG - {RESET}{time.strftime('%c')}", "", "",
+                 self.running_on, "", ""]
+        with self.lock:
+            for host in self.hosts:
+                lines.append(host.header)
+                lines.append(TESTS_HEADER)
+                lines.extend(self.render_rows(host.tests))
+                lines.append("")
+        # Home the cursor, erase what is left of each line from the previous
+        # frame, and erase everything below the new frame.
+        frame = "\033[H" + "\033[K\n".join(lines) + "\033[K\n\033[J"
+        if self.stdout_is_tty:
+            # Encode once and hand the bytes straight to the terminal,
+            # bypassing the buffered text layer of sys.stdout.
+            data = memoryview(frame.encode(sys.stdout.encoding or "utf-8", "replace"))
+            fd = sys.stdout.fileno()
+            while data:
+                data = data[os.write(fd, data):]
+        else:
+            sys.stdout.write(frame)
+            sys.stdout.flush()
+
+    def display_loop(self, interval=0.25):
+        """
+        Redraw the screen every interval seconds, independently of the test cycle.
+        If drawing fails, the error is handed to the main thread so the
+        program stops instead of probing on behind a frozen screen.
+        """
+        try:
+            while True:
+                self.display_results()
+                time.sleep(interval)
+        except Exception as e:
+            self.display_error = e
+            _thread.interrupt_main()
 
     def run(self):
-        """Continuously run tests, update history, and display results."""
-        while True:
+        """
+        Continuously run tests once per second and update history, while
+        a background thread displays the results.
+        """
+        clear_screen()
+        try:
+            next_cycle = time.perf_counter()
+            # Complete one cycle before the first frame, so tests aren't shown
+            # as DOWN while their first probe is still in flight.
             self.update_tests()
-            self.display_results()
-            self.current_index -= 1
-            if self.current_index < 0:
-                self.current_index = self.history_length - 1
-            time.sleep(1)
+            threading.Thread(target=self.display_loop, name="display", daemon=True).start()
+            while True:
+                # Schedule against the previous start rather than sleeping a
+                # fixed second, so the cycle time doesn't drift.
+                next_cycle += 1
+                delay = next_cycle - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_cycle = time.perf_counter()
+                self.update_tests()
+        except KeyboardInterrupt:
+            # The display thread interrupts us when it fails; surface its error.
+            if self.display_error is not None:
+                raise self.display_error from None
+            raise
+        finally:
+            self.executor.shutdown(cancel_futures=True)
+            self.loop.close()
 
 if __name__ == "__main__":
     if len(sys.argv) != 2: